@@ -3,7 +3,112 @@
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import importlib.util
+
+# Numba is optional; it only accelerates very large variance shifts, so it is
+# imported on first use rather than on every `driftlab generate`
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+# Below this many samples, process start-up and pickling cost more than they save
+PARALLEL_THRESHOLD = 100_000
+
+# Below this many values, JIT dispatch costs more than the fused kernel saves
+NUMBA_THRESHOLD = 1_000_000
+
+# Categorical shifts within this distance of the observed frequencies are skipped
+CATEGORY_SHIFT_TOLERANCE = 0.01
+
+WORDS = ["error", "success", "warning", "info", "debug", "critical", "request", "response", "timeout", "retry"]
+
+
+def _random_texts(rng: np.random.Generator, words: np.ndarray, lengths: np.ndarray) -> list:
+    """
+    Build one text per entry of lengths from a single batched word draw.
+    
+    Args:
+        rng: Random generator
+        words: Vocabulary array (object dtype, so draws reference the
+            existing Python strings instead of creating new ones)
+        lengths: Number of words per text
+        
+    Returns:
+        List of space-joined texts
+    """
+    if len(lengths) == 0:
+        return []
+    all_words = rng.choice(words, size=int(lengths.sum())).tolist()
+    ends = np.cumsum(lengths).tolist()
+    starts = [0] + ends[:-1]
+    join = " ".join
+    return [join(all_words[start:end]) for start, end in zip(starts, ends)]
+
+
+@lru_cache(maxsize=None)
+def _variance_shift_kernel():
+    """Build (once) the fused parallel Numba variance-shift kernel."""
+    from numba import njit, prange
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def kernel(values, out, mean_val, multiplier):
+        for i in prange(values.size):
+            out[i] = mean_val + (values[i] - mean_val) * multiplier
+    
+    return kernel
+
+
+def _variance_shift(values: np.ndarray, multiplier: float) -> np.ndarray:
+    """Scale deviations from the mean by multiplier, returning a new array."""
+    mean_val = values.mean()
+    if NUMBA_AVAILABLE and values.size >= NUMBA_THRESHOLD:
+        out = np.empty_like(values)
+        _variance_shift_kernel()(values, out, mean_val, multiplier)
+        return out
+    return mean_val + (values - mean_val) * multiplier
+
+
+def _category_codes(rng: np.random.Generator, probs: np.ndarray, n_rows: int) -> np.ndarray:
+    """
+    Assign category codes with exact target counts to randomly permuted rows.
+    
+    Args:
+        rng: Random generator
+        probs: Target probability per category
+        n_rows: Number of rows
+        
+    Returns:
+        Array of category codes
+    """
+    # Largest-remainder rounding so the counts always sum to n_rows
+    exact = probs / probs.sum() * n_rows
+    counts = np.floor(exact).astype(int)
+    remainder = n_rows - counts.sum()
+    counts[np.argsort(counts - exact)[:remainder]] += 1
+    
+    codes = np.empty(n_rows, dtype=np.int32)
+    codes[rng.permutation(n_rows)] = np.repeat(np.arange(len(probs), dtype=np.int32), counts)
+    return codes
+
+
+DEFAULT_CATEGORICAL_COLS = {
+    "status": ["success", "error", "timeout"],
+    "region": ["us-east", "us-west", "eu-west"]
+}
+
+
+def _draw_category_probs(rng: np.random.Generator, categorical_cols: Dict[str, list]) -> Dict[str, np.ndarray]:
+    """Draw each categorical column's probabilities from a uniform Dirichlet."""
+    ones_cache = {}
+    probs = {}
+    for col_name, categories in categorical_cols.items():
+        k = len(categories)
+        if k not in ones_cache:
+            ones_cache[k] = np.ones(k)
+        probs[col_name] = rng.dirichlet(ones_cache[k])
+    return probs
 
 
 def generate_baseline_dataset(
@@ -11,7 +116,8 @@ def generate_baseline_dataset(
     numerical_cols: Optional[Dict[str, Dict[str, float]]] = None,
     categorical_cols: Optional[Dict[str, list]] = None,
     text_cols: Optional[Dict[str, int]] = None,
-    seed: int = 42
+    seed: int = 42,
+    category_probs: Optional[Dict[str, np.ndarray]] = None
 ) -> pd.DataFrame:
     """
     Generate baseline/reference dataset.
@@ -22,11 +128,13 @@ def generate_baseline_dataset(
         categorical_cols: Dict of {col_name: [list of categories]}
         text_cols: Dict of {col_name: avg_length}
         seed: Random seed
+        category_probs: Per-column category probabilities (drawn from a
+            uniform Dirichlet with the seed's generator if None)
         
     Returns:
         Generated DataFrame
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     
     if numerical_cols is None:
         numerical_cols = {
@@ -36,10 +144,7 @@ def generate_baseline_dataset(
         }
     
     if categorical_cols is None:
-        categorical_cols = {
-            "status": ["success", "error", "timeout"],
-            "region": ["us-east", "us-west", "eu-west"]
-        }
+        categorical_cols = DEFAULT_CATEGORICAL_COLS
     
     if text_cols is None:
         text_cols = {
@@ -49,28 +154,33 @@ def generate_baseline_dataset(
     data = {}
     
     # Generate numerical columns
-    for col_name, params in numerical_cols.items():
-        data[col_name] = np.random.normal(
-            params["mean"],
-            params["std"],
-            n_samples
-        )
+    # Blocks are drawn column-major (one row per column) so each column is a
+    # contiguous array rather than a strided view
+    names = list(numerical_cols)
+    means = np.fromiter((numerical_cols[n]["mean"] for n in names), float, count=len(names))
+    stds = np.fromiter((numerical_cols[n]["std"] for n in names), float, count=len(names))
+    block = rng.standard_normal((len(names), n_samples)) * stds[:, None] + means[:, None]
+    for i, col_name in enumerate(names):
+        data[col_name] = block[i]
     
     # Generate categorical columns
-    for col_name, categories in categorical_cols.items():
-        probs = np.random.dirichlet(np.ones(len(categories)))
-        data[col_name] = np.random.choice(categories, size=n_samples, p=probs)
+    # One uniform draw for all categorical columns, mapped to codes through
+    # each column's cumulative probabilities
+    uniforms = rng.random((len(categorical_cols), n_samples))
+    if category_probs is None:
+        category_probs = _draw_category_probs(rng, categorical_cols)
+    for i, (col_name, categories) in enumerate(categorical_cols.items()):
+        k = len(categories)
+        codes = np.searchsorted(np.cumsum(category_probs[col_name]), uniforms[i], side="right")
+        # Guard against the cumulative sum rounding to just below 1.0
+        codes = np.minimum(codes, k - 1)
+        data[col_name] = pd.Categorical.from_codes(codes, categories=categories)
     
     # Generate text columns
-    words = ["error", "success", "warning", "info", "debug", "critical", "request", "response", "timeout", "retry"]
+    words_arr = np.array(WORDS, dtype=object)
     for col_name, avg_length in text_cols.items():
-        texts = []
-        for _ in range(n_samples):
-            n_words = int(np.random.normal(avg_length, avg_length * 0.3))
-            n_words = max(1, n_words)
-            text = " ".join(np.random.choice(words, size=n_words))
-            texts.append(text)
-        data[col_name] = texts
+        lengths = np.clip(rng.normal(avg_length, avg_length * 0.3, n_samples).astype(int), 1, None)
+        data[col_name] = _random_texts(rng, words_arr, lengths)
     
     return pd.DataFrame(data)
 
@@ -91,7 +201,7 @@ def generate_drifted_dataset(
     Returns:
         DataFrame with drift applied
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     
     if drift_config is None:
         drift_config = {
@@ -110,48 +220,64 @@ def generate_drifted_dataset(
             }
         }
     
-    drifted_df = baseline_df.copy()
+    # Untouched columns are shared with the baseline; shifted columns are
+    # replaced with new arrays, so the baseline frame is never copied as a whole
+    drifted = {col: baseline_df[col] for col in baseline_df.columns}
+    n_rows = len(baseline_df)
     
     # Apply numerical mean shifts
     for col, multiplier in drift_config.get("numerical_mean_shift", {}).items():
-        if col in drifted_df.columns:
-            drifted_df[col] = drifted_df[col] * multiplier
+        if col in drifted:
+            drifted[col] = drifted[col].to_numpy() * multiplier
     
     # Apply numerical variance shifts
     for col, multiplier in drift_config.get("numerical_variance_shift", {}).items():
-        if col in drifted_df.columns:
-            mean_val = drifted_df[col].mean()
-            drifted_df[col] = mean_val + (drifted_df[col] - mean_val) * multiplier
+        if col in drifted:
+            drifted[col] = _variance_shift(np.asarray(drifted[col], dtype=float), multiplier)
     
     # Apply categorical shifts
     for col, new_probs in drift_config.get("categorical_shift", {}).items():
-        if col in drifted_df.columns:
+        if col in drifted:
             categories = list(new_probs.keys())
-            probs = list(new_probs.values())
-            drifted_df[col] = np.random.choice(categories, size=len(drifted_df), p=probs)
+            probs = np.array(list(new_probs.values()), dtype=float)
+            observed = pd.Series(drifted[col]).value_counts(normalize=True)
+            if all(abs(observed.get(cat, 0.0) - p) <= CATEGORY_SHIFT_TOLERANCE for cat, p in new_probs.items()):
+                continue
+            drifted[col] = pd.Categorical.from_codes(_category_codes(rng, probs, n_rows), categories=categories)
     
     # Apply text length shifts
+    words_arr = np.array(WORDS, dtype=object)
     for col, multiplier in drift_config.get("text_length_shift", {}).items():
-        if col in drifted_df.columns:
-            texts = drifted_df[col].astype(str)
-            words = ["error", "success", "warning", "info", "debug", "critical", "request", "response", "timeout", "retry"]
-            new_texts = []
-            for text in texts:
-                words_list = text.split()
-                new_length = int(len(words_list) * multiplier)
-                new_length = max(1, new_length)
-                # Add some new words to simulate vocabulary shift
-                new_text = " ".join(np.random.choice(words, size=new_length))
-                new_texts.append(new_text)
-            drifted_df[col] = new_texts
-    
-    return drifted_df
+        if col in drifted:
+            texts = pd.Series(drifted[col])
+            if not pd.api.types.is_string_dtype(texts):
+                texts = texts.astype(str)
+            # Count words without materializing the split lists
+            orig_lens = texts.str.count(r"\S+").fillna(0).to_numpy(dtype=int)
+            new_lens = np.maximum(1, (orig_lens * multiplier).astype(int))
+            # Add some new words to simulate vocabulary shift
+            drifted[col] = _random_texts(rng, words_arr, new_lens)
+    
+    return pd.DataFrame(drifted, index=baseline_df.index, copy=False)
+
+
+def _generate_chunk(
+    n_samples: int,
+    seed: int,
+    category_probs: Dict[str, np.ndarray]
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Generate one reference/current chunk pair (process pool worker)."""
+    ref_df = generate_baseline_dataset(n_samples=n_samples, seed=seed, category_probs=category_probs)
+    cur_df = generate_drifted_dataset(ref_df, seed=seed + 1)
+    return ref_df, cur_df
 
 
 def generate_demo_data(
     output_dir: str = "data",
     n_samples: int = 1000,
-    seed: int = 42
+    seed: int = 42,
+    workers: int = 1,
+    file_format: str = "parquet"
 ) -> None:
     """
     Generate demo reference and current datasets with drift.
@@ -160,25 +286,47 @@ def generate_demo_data(
         output_dir: Output directory
         n_samples: Number of samples
         seed: Random seed
+        workers: Number of worker processes (only used above PARALLEL_THRESHOLD samples)
+        file_format: Output format (parquet, feather or csv)
     """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    # Generate baseline
-    ref_df = generate_baseline_dataset(n_samples=n_samples, seed=seed)
-    
-    # Generate drifted current dataset
-    cur_df = generate_drifted_dataset(ref_df, seed=seed + 1)
+    if workers > 1 and n_samples > PARALLEL_THRESHOLD:
+        # Category probabilities are drawn once so every chunk samples the same
+        # distribution; only the row draws are split across processes. Each
+        # chunk gets its own child seed; output is reproducible for a given
+        # (seed, workers) pair.
+        category_probs = _draw_category_probs(np.random.default_rng(seed), DEFAULT_CATEGORICAL_COLS)
+        sizes = [len(chunk) for chunk in np.array_split(np.arange(n_samples), workers)]
+        seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(_generate_chunk, sizes, seeds, [category_probs] * workers))
+        ref_df = pd.concat([ref for ref, _ in chunks], ignore_index=True)
+        cur_df = pd.concat([cur for _, cur in chunks], ignore_index=True)
+    else:
+        # Generate baseline
+        ref_df = generate_baseline_dataset(n_samples=n_samples, seed=seed)
+        
+        # Generate drifted current dataset
+        cur_df = generate_drifted_dataset(ref_df, seed=seed + 1)
     
     # Save
-    ref_path = output_path / "reference" / "ref.csv"
-    cur_path = output_path / "current" / "cur.csv"
+    ref_path = output_path / "reference" / f"ref.{file_format}"
+    cur_path = output_path / "current" / f"cur.{file_format}"
     
     ref_path.parent.mkdir(parents=True, exist_ok=True)
     cur_path.parent.mkdir(parents=True, exist_ok=True)
     
-    ref_df.to_csv(ref_path, index=False)
-    cur_df.to_csv(cur_path, index=False)
+    for df, path in ((ref_df, ref_path), (cur_df, cur_path)):
+        if file_format == "parquet":
+            df.to_parquet(path, index=False)
+        elif file_format == "feather":
+            df.to_feather(path)
+        elif file_format == "csv":
+            df.to_csv(path, index=False)
+        else:
+            raise ValueError(f"Unsupported output format: {file_format}")
     
     print(f"Generated reference dataset: {ref_path}")
     print(f"Generated current dataset: {cur_path}")
@@ -193,7 +341,9 @@ if __name__ == "__main__":
     parser.add_argument("--output-dir", default="data", help="Output directory")
     parser.add_argument("--n-samples", type=int, default=1000, help="Number of samples")
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for large datasets")
+    parser.add_argument("--format", default="parquet", choices=["parquet", "feather", "csv"], help="Output file format")
     
     args = parser.parse_args()
-    generate_demo_data(args.output_dir, args.n_samples, args.seed)
+    generate_demo_data(args.output_dir, args.n_samples, args.seed, args.workers, args.format)
 
@@ -1,8 +1,10 @@
 """Alert rule implementations."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Deque
 from pathlib import Path
-import json
+from collections import deque
+import os
+from driftlab.io.jsonio import read_json, write_json
 from .base import AlertRule
 from .thresholds import ThresholdCalibrator
 
@@ -62,7 +64,8 @@ class FeatureDriftPersistenceRule(AlertRule):
         threshold: Optional[float] = None,
         consecutive_runs: int = 3,
         calibrator: Optional[ThresholdCalibrator] = None,
-        history_file: Optional[str] = None
+        history_file: Optional[str] = None,
+        autosave: bool = True
     ):
         """
         Initialize persistence rule.
@@ -72,28 +75,47 @@ class FeatureDriftPersistenceRule(AlertRule):
             consecutive_runs: Number of consecutive runs required
             calibrator: Threshold calibrator
             history_file: Path to history file for persistence tracking
+            autosave: Write history after every evaluate() call; if False,
+                updates are buffered until flush() is called
         """
         self.threshold = threshold
         self.consecutive_runs = consecutive_runs
         self.calibrator = calibrator
         self.history_file = history_file or ".driftlab_history.json"
+        self.autosave = autosave
+        self._history: Optional[Dict[str, Deque[bool]]] = None
+        self._dirty = False
     
-    def _load_persistence_history(self) -> Dict[str, List[bool]]:
-        """Load persistence history for features."""
+    def _load_persistence_history(self) -> Dict[str, Deque[bool]]:
+        """Load persistence history for features, capped at consecutive_runs entries each."""
         if not Path(self.history_file).exists():
             return {}
         
         try:
-            with open(self.history_file, 'r') as f:
-                return json.load(f)
+            history = read_json(self.history_file)
+            # Anything but a feature -> runs mapping (e.g. a calibrator's metric list) is not ours
+            if not isinstance(history, dict):
+                return {}
+            return {
+                col_name: deque(runs, maxlen=self.consecutive_runs)
+                for col_name, runs in history.items()
+            }
         except Exception:
             return {}
     
-    def _save_persistence_history(self, history: Dict[str, List[bool]]) -> None:
-        """Save persistence history."""
-        Path(self.history_file).parent.mkdir(parents=True, exist_ok=True)
-        with open(self.history_file, 'w') as f:
-            json.dump(history, f, indent=2)
+    def _save_persistence_history(self, history: Dict[str, Deque[bool]]) -> None:
+        """Save persistence history atomically (write to a temp file, then replace)."""
+        path = Path(self.history_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        write_json(tmp_path, {col_name: list(runs) for col_name, runs in history.items()})
+        os.replace(tmp_path, path)
+    
+    def flush(self) -> None:
+        """Write buffered persistence history to disk if it has changed."""
+        if self._dirty and self._history is not None:
+            self._save_persistence_history(self._history)
+            self._dirty = False
     
     def evaluate(self, metrics_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Evaluate feature drift persistence."""
@@ -106,8 +128,10 @@ class FeatureDriftPersistenceRule(AlertRule):
         if threshold is None:
             threshold = 0.3  # Default
         
-        # Load persistence history
-        persistence_history = self._load_persistence_history()
+        # Load persistence history once; later calls reuse the in-memory copy
+        if self._history is None:
+            self._history = self._load_persistence_history()
+        persistence_history = self._history
         
         # Check column drift scores
         column_drift_scores = metrics_dict.get("column_drift_scores", {})
@@ -116,19 +140,16 @@ class FeatureDriftPersistenceRule(AlertRule):
             drift_score = col_metrics.get("drift_score", 0.0)
             drift_detected = drift_score >= threshold
             
-            # Update history
-            if col_name not in persistence_history:
-                persistence_history[col_name] = []
-            
-            persistence_history[col_name].append(drift_detected)
-            
-            # Keep only last N runs
-            if len(persistence_history[col_name]) > self.consecutive_runs:
-                persistence_history[col_name] = persistence_history[col_name][-self.consecutive_runs:]
+            # Update history (deque drops runs older than the last N)
+            runs = persistence_history.get(col_name)
+            if runs is None:
+                runs = persistence_history[col_name] = deque(maxlen=self.consecutive_runs)
+            runs.append(drift_detected)
+            self._dirty = True
             
             # Check if persistent
-            if len(persistence_history[col_name]) >= self.consecutive_runs:
-                if all(persistence_history[col_name][-self.consecutive_runs:]):
+            if len(runs) == self.consecutive_runs:
+                if all(runs):
                     alerts.append({
                         "severity": "critical",
                         "message": f"Feature {col_name} has drifted above threshold for {self.consecutive_runs} consecutive runs",
@@ -139,7 +160,8 @@ class FeatureDriftPersistenceRule(AlertRule):
                     })
         
         # Save updated history
-        self._save_persistence_history(persistence_history)
+        if self.autosave:
+            self.flush()
         
         return alerts
 
@@ -2,7 +2,8 @@
 
 from typing import Dict, Any, List, Optional
 from pathlib import Path
-import json
+import numpy as np
+from driftlab.io.jsonio import read_json, write_json
 
 
 class ThresholdCalibrator:
@@ -17,14 +18,15 @@ class ThresholdCalibrator:
         """
         self.history_file = history_file
         self.history: List[Dict[str, Any]] = []
+        # Historical values per metric, rebuilt lazily after history changes
+        self._values_by_metric: Dict[str, np.ndarray] = {}
         if history_file and Path(history_file).exists():
             self._load_history()
     
     def _load_history(self) -> None:
         """Load historical metrics from file."""
         try:
-            with open(self.history_file, 'r') as f:
-                self.history = json.load(f)
+            self.history = read_json(self.history_file)
         except Exception:
             self.history = []
     
@@ -32,12 +34,12 @@ class ThresholdCalibrator:
         """Save historical metrics to file."""
         if self.history_file:
             Path(self.history_file).parent.mkdir(parents=True, exist_ok=True)
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history, f, indent=2, default=str)
+            write_json(self.history_file, self.history)
     
     def add_metrics(self, metrics: Dict[str, Any]) -> None:
         """Add current metrics to history."""
         self.history.append(metrics)
+        self._values_by_metric.clear()
         self._save_history()
     
     def calibrate_threshold(
@@ -59,15 +61,23 @@ class ThresholdCalibrator:
             # Default threshold if no history
             return 0.3
         
-        values = []
-        for entry in self.history:
-            if metric_name in entry:
-                values.append(entry[metric_name])
+        values = self._values_by_metric.get(metric_name)
+        if values is None:
+            values = np.array(
+                [entry[metric_name] for entry in self.history if metric_name in entry],
+                dtype=float
+            )
+            self._values_by_metric[metric_name] = values
         
-        if not values:
+        if values.size == 0:
             return 0.3
         
-        import numpy as np
-        threshold = np.percentile(values, percentile)
+        # Linear-interpolated percentile (same as np.percentile) via an O(n)
+        # partial sort around the two neighbouring ranks
+        position = percentile / 100.0 * (values.size - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, values.size - 1)
+        partitioned = np.partition(values, (lower, upper))
+        threshold = partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (position - lower)
         return float(threshold)
 
@@ -22,6 +22,8 @@ def main():
     gen_parser.add_argument('--output-dir', default='data', help='Output directory')
     gen_parser.add_argument('--n-samples', type=int, default=1000, help='Number of samples')
     gen_parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    gen_parser.add_argument('--workers', type=int, default=1, help='Worker processes for large datasets')
+    gen_parser.add_argument('--format', default='parquet', choices=['parquet', 'feather', 'csv'], help='Output file format')
     
     args = parser.parse_args()
     
@@ -56,7 +58,7 @@ def main():
         project_root = Path(__file__).parent.parent
         sys.path.insert(0, str(project_root))
         from data.synthetic.generate import generate_demo_data
-        generate_demo_data(args.output_dir, args.n_samples, args.seed)
+        generate_demo_data(args.output_dir, args.n_samples, args.seed, args.workers, args.format)
     else:
         parser.print_help()
         sys.exit(1)
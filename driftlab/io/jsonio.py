@@ -0,0 +1,45 @@
+"""JSON read/write helpers backed by orjson when available."""
+
+from pathlib import Path
+from typing import Any, Union
+import json
+
+# orjson is an optional speedup; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file.
+    
+    Files written by the stdlib encoder may contain NaN/Infinity tokens,
+    which orjson rejects; those are parsed with the stdlib decoder instead.
+    """
+    data = Path(path).read_bytes()
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def write_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Write data to a JSON file with 2-space indentation.
+    
+    Values that are not JSON-serializable are written as strings.
+    """
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        payload = json.dumps(data, indent=2, default=str).encode("utf-8")
+    Path(path).write_bytes(payload)
@@ -1,17 +1,70 @@
 """Data loading utilities."""
 
+import csv
 import pandas as pd
 from pathlib import Path
 from typing import Optional
 
+# pyarrow's multithreaded CSV reader is used when available
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# pd.read_csv's default NA markers (the documented na_values defaults)
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null"
+]
+
+
+def _has_plain_header(path: Path) -> bool:
+    """Whether every header name is non-blank and unique (pandas would rename neither)."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), [])
+    return all(header) and len(set(header)) == len(header)
+
+
+def _read_csv_pyarrow(path: Path) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow, matching pd.read_csv's default parsing.
+    
+    Blank cells and pandas' default NA markers ("NA", "N/A", ...) become
+    nulls in string columns too. Columns pyarrow would infer as dates or
+    timestamps are kept as text, as pandas does without parse_dates, and
+    all-empty columns are read as float64. Headers pandas would rename
+    ("Unnamed: 0", "a.1") are left to the caller (see _has_plain_header).
+    """
+    convert_options = pacsv.ConvertOptions(
+        strings_can_be_null=True,
+        null_values=PANDAS_NA_VALUES
+    )
+    table = pacsv.read_csv(path, convert_options=convert_options)
+    column_types = {}
+    for field in table.schema:
+        if pa.types.is_temporal(field.type):
+            column_types[field.name] = pa.string()
+        elif pa.types.is_null(field.type):
+            column_types[field.name] = pa.float64()
+    if column_types:
+        convert_options.column_types = column_types
+        table = pacsv.read_csv(path, convert_options=convert_options)
+    return table.to_pandas()
+
 
 def load_dataframe(file_path: str, **kwargs) -> pd.DataFrame:
     """
-    Load a CSV file into a pandas DataFrame.
+    Load a CSV, Parquet or Feather file into a pandas DataFrame.
+    
+    The reader is chosen from the file extension.
     
     Args:
-        file_path: Path to CSV file
-        **kwargs: Additional arguments to pass to pd.read_csv
+        file_path: Path to data file
+        **kwargs: Additional arguments to pass to pd.read_csv (CSV only;
+            passing any disables the pyarrow CSV reader)
         
     Returns:
         Loaded DataFrame
@@ -20,5 +73,11 @@ def load_dataframe(file_path: str, **kwargs) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        return pd.read_parquet(path)
+    if suffix == ".feather":
+        return pd.read_feather(path)
+    if PYARROW_AVAILABLE and not kwargs and _has_plain_header(path):
+        return _read_csv_pyarrow(path)
     return pd.read_csv(file_path, **kwargs)
-
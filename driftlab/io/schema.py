@@ -1,6 +1,8 @@
 """Data schema validation and quality checks."""
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+from collections import namedtuple
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -13,6 +15,51 @@ class ColumnType:
     TIMESTAMP = "timestamp"
 
 
+class ErrorCode:
+    """Schema validation error codes."""
+    MISSING_REQUIRED = "MISSING_REQUIRED"
+
+
+_ERROR_MESSAGES = {
+    ErrorCode.MISSING_REQUIRED: "Missing required columns: {columns}",
+}
+
+
+class SchemaError(namedtuple("SchemaError", "code columns")):
+    """Structured validation error; the message is only formatted when read."""
+    
+    __slots__ = ()
+    
+    @property
+    def message(self) -> str:
+        """Human-readable error message."""
+        return _ERROR_MESSAGES[self.code].format(columns=list(self.columns))
+    
+    def __str__(self) -> str:
+        return self.message
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form, identical under every JSON backend."""
+        return {"code": self.code, "columns": list(self.columns), "message": self.message}
+
+
+def _categorical_summary(series: pd.Series, top_k: int = 5) -> Tuple[int, Dict[Any, int]]:
+    """
+    Unique count and top values of a categorical-dtype column from its codes.
+    
+    One bincount over the integer codes replaces separate nunique and
+    value_counts passes. Only observed categories are reported, matching
+    the object-dtype path.
+    """
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    order = np.argsort(-counts, kind="stable")[:top_k]
+    order = order[counts[order] > 0]
+    # tolist() yields Python scalars, so numeric categories stay JSON-serializable keys
+    top_values = dict(zip(series.cat.categories[order].tolist(), counts[order].tolist()))
+    return int(np.count_nonzero(counts)), top_values
+
+
 class Schema:
     """Data schema definition and validation."""
     
@@ -34,13 +81,61 @@ class Schema:
         self.required_columns = required_columns or []
         self.timestamp_column = timestamp_column
     
-    def validate(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _plan(self, columns: pd.Index) -> Tuple[set, List[str], List[str]]:
+        """
+        Resolve the schema against a column layout.
+        
+        Returns:
+            Tuple of (missing required columns, numerical columns, categorical columns)
+        """
+        missing_cols = set(self.required_columns) - set(columns)
+        num_cols = [c for c in columns if self.column_types.get(c) == ColumnType.NUMERICAL]
+        cat_cols = [c for c in columns if self.column_types.get(c) == ColumnType.CATEGORICAL]
+        return missing_cols, num_cols, cat_cols
+    
+    def validate_batch(self, dfs: Iterable[pd.DataFrame], early_exit: bool = True) -> List[Dict[str, Any]]:
+        """
+        Validate several DataFrames, resolving the schema once per column layout.
+        
+        Args:
+            dfs: DataFrames to validate
+            early_exit: See validate()
+            
+        Returns:
+            List of validation results, one per DataFrame
+        """
+        plans = {}
+        results = []
+        for df in dfs:
+            layout = tuple(df.columns)
+            if layout not in plans:
+                plans[layout] = self._plan(df.columns)
+            results.append(self._validate_with_plan(df, plans[layout], early_exit))
+        return results
+    
+    def validate(self, df: pd.DataFrame, early_exit: bool = True) -> Dict[str, Any]:
         """
         Validate DataFrame against schema and perform quality checks.
         
+        Args:
+            df: DataFrame to validate
+            early_exit: Return as soon as required columns are found missing,
+                without computing quality metrics
+            
         Returns:
-            Dictionary with validation results and quality metrics
+            Dictionary with validation results and quality metrics; errors
+            are SchemaError entries
         """
+        return self._validate_with_plan(df, self._plan(df.columns), early_exit)
+    
+    def _validate_with_plan(
+        self,
+        df: pd.DataFrame,
+        plan: Tuple[set, List[str], List[str]],
+        early_exit: bool
+    ) -> Dict[str, Any]:
+        """Validate a DataFrame using a plan from _plan()."""
+        missing_cols, num_cols, cat_cols = plan
         results = {
             "valid": True,
             "errors": [],
@@ -49,13 +144,18 @@ class Schema:
         }
         
         # Check required columns
-        missing_cols = set(self.required_columns) - set(df.columns)
         if missing_cols:
             results["valid"] = False
-            results["errors"].append(f"Missing required columns: {missing_cols}")
+            results["errors"].append(SchemaError(ErrorCode.MISSING_REQUIRED, tuple(sorted(missing_cols))))
+            if early_exit:
+                return results
+        
+        # Null mask is reused for the empty-column check and quality metrics
+        isnull_df = df.isnull()
+        all_missing = isnull_df.all()
         
         # Check for empty columns
-        empty_cols = df.columns[df.isnull().all()].tolist()
+        empty_cols = df.columns[all_missing].tolist()
         if empty_cols:
             results["warnings"].append(f"Empty columns detected: {empty_cols}")
         
@@ -66,20 +166,35 @@ class Schema:
             except Exception as e:
                 results["warnings"].append(f"Failed to parse timestamp column: {e}")
         
-        # Quality metrics
+        # Quality metrics (computed frame-wide, then split per column)
+        # Categorical-dtype columns are summarized from their integer codes
+        cat_summaries = {
+            col: _categorical_summary(df[col])
+            for col in cat_cols if isinstance(df[col].dtype, pd.CategoricalDtype)
+        }
+        missing_counts = isnull_df.sum()
+        other_cols = [c for c in df.columns if c not in cat_summaries]
+        unique_counts = df[other_cols].nunique(dropna=True).to_dict()
+        min_max = df[num_cols].agg(['min', 'max']) if num_cols else None
+        top_values = {
+            col: df[col].value_counts().head(5).to_dict() for col in cat_cols if col not in cat_summaries
+        }
+        for col, (unique_count, col_top_values) in cat_summaries.items():
+            unique_counts[col] = unique_count
+            top_values[col] = col_top_values
+        
         quality = {}
         for col in df.columns:
-            col_type = self.column_types.get(col, "unknown")
             quality[col] = {
-                "missing_pct": (df[col].isnull().sum() / len(df)) * 100,
-                "unique_count": df[col].nunique(),
+                "missing_pct": (missing_counts[col] / len(df)) * 100,
+                "unique_count": int(unique_counts[col]),
             }
             
-            if col_type == ColumnType.NUMERICAL:
-                quality[col]["min"] = float(df[col].min()) if not df[col].isnull().all() else None
-                quality[col]["max"] = float(df[col].max()) if not df[col].isnull().all() else None
-            elif col_type == ColumnType.CATEGORICAL:
-                quality[col]["top_values"] = df[col].value_counts().head(5).to_dict()
+            if col in top_values:
+                quality[col]["top_values"] = top_values[col]
+            elif min_max is not None and col in min_max.columns:
+                quality[col]["min"] = None if all_missing[col] else float(min_max.at['min', col])
+                quality[col]["max"] = None if all_missing[col] else float(min_max.at['max', col])
         
         results["quality_metrics"] = quality
         
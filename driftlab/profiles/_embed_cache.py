@@ -0,0 +1,98 @@
+"""On-disk cache of text embeddings keyed by model name and text hash."""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+import hashlib
+import os
+import numpy as np
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "driftlab" / "embeddings"
+
+# About 75 MB of float32 vectors for a 384-dimensional model
+DEFAULT_MAX_ENTRIES = 50_000
+
+
+def text_key(text: str) -> str:
+    """Stable cache key for a text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Persistent embedding store for a single model.
+    
+    Entries are kept in least-recently-used order (dict insertion order, also
+    preserved on disk); save() evicts the oldest beyond max_entries.
+    """
+    
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Initialize cache and load any stored embeddings.
+        
+        Args:
+            model_name: Model the embeddings were produced with
+            cache_dir: Root cache directory (defaults to ~/.cache/driftlab/embeddings)
+            max_entries: Maximum number of embeddings kept on disk
+        """
+        root = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.path = root / model_name.replace("/", "__") / "embeddings.npz"
+        self.max_entries = max_entries
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._dirty = False
+        if self.path.exists():
+            self._load()
+    
+    def _load(self) -> None:
+        """Load stored embeddings; a corrupt cache is treated as empty."""
+        try:
+            with np.load(self.path) as stored:
+                keys, vectors = stored["keys"], stored["vectors"]
+            self._vectors = dict(zip(keys.tolist(), vectors))
+        except Exception:
+            self._vectors = {}
+    
+    def find_uncached_texts(self, texts: List[str]) -> List[str]:
+        """Return the unique texts that have no stored embedding, marking the rest as recently used."""
+        missing = {}
+        for text in texts:
+            key = text_key(text)
+            vector = self._vectors.pop(key, None)
+            if vector is None:
+                missing[text] = None
+            else:
+                # Recency alone does not trigger a rewrite; it is persisted with the next save
+                self._vectors[key] = vector
+        return list(missing)
+    
+    def add(self, texts: List[str], vectors: np.ndarray) -> None:
+        """Store embeddings for texts (one row per text)."""
+        for text, vector in zip(texts, vectors):
+            self._vectors[text_key(text)] = vector
+        self._dirty = True
+    
+    def lookup(self, texts: List[str]) -> np.ndarray:
+        """Stack stored embeddings for texts; every text must be cached."""
+        return np.stack([self._vectors[text_key(text)] for text in texts])
+    
+    def save(self) -> None:
+        """Write the cache atomically if it has changed, evicting entries over the limit."""
+        if not self._dirty:
+            return
+        for key in list(self._vectors)[:max(len(self._vectors) - self.max_entries, 0)]:
+            del self._vectors[key]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                keys=np.array(list(self._vectors), dtype="U32"),
+                vectors=np.stack(list(self._vectors.values()))
+            )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
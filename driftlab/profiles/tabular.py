@@ -3,7 +3,6 @@
 from typing import Dict, Any, Optional
 import pandas as pd
 from .base import Profile
-from driftlab.reports.evidently_report import generate_evidently_report
 
 
 class TabularProfile(Profile):
@@ -1,9 +1,15 @@
 """Text drift profiling for NLP features."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import os
+import threading
 import pandas as pd
 import numpy as np
 from .base import Profile
+from ._embed_cache import EmbeddingCache
 
 # Lazy import for sentence_transformers to avoid dependency issues
 SENTENCE_TRANSFORMERS_AVAILABLE = False
@@ -15,90 +21,294 @@ try:
 except Exception:
     pass
 
+# Pre-quantized int8 ONNX export shipped with sentence-transformers hub models
+ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Supported model precisions for TextProfile
+PRECISIONS = ("fp32", "fp16", "int8")
+
+# Below this many texts per side, embedding shift is noise and is skipped
+MIN_EMBEDDING_SAMPLES = 32
+
+# Encode batch sizes; sentence-transformers length-sorts texts before
+# batching, so large GPU batches add little padding
+GPU_ENCODE_BATCH_SIZE = 1024
+CPU_ENCODE_BATCH_SIZE = 64
+
+def _detect_text_columns(df: pd.DataFrame) -> List[str]:
+    """Detect text columns (string type with high cardinality)."""
+    string_df = df.select_dtypes(include=['object', 'string'])
+    unique_ratios = string_df.nunique() / len(df)
+    return unique_ratios[unique_ratios > 0.1].index.tolist()  # High cardinality suggests text
+
+
+def _select_device() -> str:
+    """
+    Pick the fastest available torch device for encoding.
+    
+    On CPU, torch intra-op threads are capped at 8, where encode throughput
+    stops improving, and inter-op parallelism is disabled since encode runs
+    one batch at a time.
+    """
+    import torch
+    
+    if torch.cuda.is_available():
+        return "cuda"
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    torch.set_num_threads(min(8, os.cpu_count() or 1))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only settable before any inter-op work has started in this process
+        pass
+    return "cpu"
+
+
+def _embedding_moments(embeddings: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Compute the centroid and overall element variance of an embedding matrix.
+    
+    Uses one column-sum and one sum-of-squares pass (accumulated in float64)
+    instead of separate mean and var traversals.
+    """
+    n_rows, n_dims = embeddings.shape
+    column_sums = embeddings.sum(axis=0, dtype=np.float64)
+    sum_squares = float(np.einsum('ij,ij->', embeddings, embeddings, dtype=np.float64))
+    centroid = column_sums / n_rows
+    overall_mean = column_sums.sum() / (n_rows * n_dims)
+    variance = max(sum_squares / (n_rows * n_dims) - overall_mean ** 2, 0.0)
+    return centroid, variance
+
+
+@lru_cache(maxsize=4)
+def _load_model(model_name: str, device: str, backend: str, precision: str) -> Tuple[Any, str, str]:
+    """
+    Load a SentenceTransformer once per process and share it between profiles.
+    
+    Returns:
+        Tuple of (model, backend actually used, precision actually used)
+    """
+    from sentence_transformers import SentenceTransformer
+    
+    if backend == "onnx" and device == "cpu":
+        try:
+            model = SentenceTransformer(
+                model_name,
+                device=device,
+                backend="onnx",
+                model_kwargs={"file_name": ONNX_INT8_FILE}
+            )
+            return model, "onnx", "int8"
+        except Exception:
+            pass
+    model = SentenceTransformer(model_name, device=device)
+    if precision == "int8" and device == "cpu":
+        import torch
+        
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return model, "torch", "int8"
+    if precision == "fp16" and device != "cpu":
+        return model.half(), "torch", "fp16"
+    return model, "torch", "fp32"
+
 
 class TextProfile(Profile):
     """Text data drift profile."""
     
-    def __init__(self, text_columns: Optional[List[str]] = None, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        text_columns: Optional[List[str]] = None,
+        model_name: str = "all-MiniLM-L6-v2",
+        device: Optional[str] = None,
+        use_embedding_cache: bool = True,
+        cache_dir: Optional[str] = None,
+        backend: str = "torch",
+        precision: str = "fp32"
+    ):
         """
         Initialize text profile.
         
         Args:
             text_columns: List of column names containing text data
             model_name: Sentence transformer model name
+            device: Torch device for the model (auto-detects cuda/mps/cpu if None)
+            use_embedding_cache: Reuse embeddings stored on disk from earlier runs
+            cache_dir: Embedding cache directory (defaults to ~/.cache/driftlab/embeddings)
+            backend: "torch", or "onnx" to run an int8-quantized ONNX Runtime
+                model on CPU (falls back to torch if it cannot be loaded)
+            precision: "fp32", "fp16" (GPU only) or "int8" (dynamic
+                quantization, CPU only); unsupported combinations use fp32
         """
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unsupported precision: {precision}")
         self.text_columns = text_columns
         self.model_name = model_name
+        self.device = device
+        self.backend = backend
+        self.precision = precision
         self.model = None
+        self.embedding_cache = None
+        # Columns are analyzed in threads; the model and cache are not shared concurrently
+        self._encode_lock = threading.Lock()
         if SENTENCE_TRANSFORMERS_AVAILABLE:
             try:
-                from sentence_transformers import SentenceTransformer
-                self.model = SentenceTransformer(model_name)
+                if self.device is None:
+                    self.device = _select_device()
+                self.model, self.backend, self.precision = _load_model(
+                    model_name, self.device, backend, precision
+                )
             except Exception:
                 self.model = None
+        if self.model is not None and use_embedding_cache:
+            # Reduced-precision embeddings differ slightly, so they get their own cache
+            if self.backend == "onnx":
+                cache_name = f"{model_name}-onnx-int8"
+            elif self.precision != "fp32":
+                cache_name = f"{model_name}-{self.precision}"
+            else:
+                cache_name = model_name
+            self.embedding_cache = EmbeddingCache(cache_name, cache_dir=cache_dir)
+    
+    def _model_encode(self, texts: List[str], **encode_kwargs) -> np.ndarray:
+        """
+        Run the model with autograd disabled for the duration of the call.
+        
+        sentence-transformers groups texts into batches by character length.
+        When there is more than one batch, texts are instead tokenized once,
+        grouped by token count (which is what determines padding), padded per
+        batch and passed straight to the model's forward pass, so nothing is
+        tokenized twice. Embeddings are returned in input order, unnormalized.
+        """
+        import torch
+        
+        batch_size = encode_kwargs["batch_size"]
+        tokenizer = getattr(self.model, "tokenizer", None)
+        if len(texts) <= batch_size or tokenizer is None:
+            with torch.inference_mode():
+                return self.model.encode(texts, **encode_kwargs)
+        
+        # Unpadded features; whitespace is stripped as SentenceTransformer.tokenize does
+        features = tokenizer(
+            [text.strip() for text in texts],
+            truncation=True,
+            max_length=self.model.max_seq_length
+        )
+        lengths = np.fromiter(map(len, features["input_ids"]), dtype=np.int32, count=len(texts))
+        order = np.argsort(lengths, kind="stable")
+        batches = []
+        with torch.inference_mode():
+            for start in range(0, len(texts), batch_size):
+                rows = order[start:start + batch_size]
+                batch = tokenizer.pad(
+                    {key: [values[i] for i in rows] for key, values in features.items()},
+                    return_tensors="pt"
+                )
+                batch = {key: value.to(self.model.device) for key, value in batch.items()}
+                batches.append(self.model(batch)["sentence_embedding"].float().cpu().numpy())
+        embeddings = np.empty((len(texts), batches[0].shape[1]), dtype=np.float32)
+        embeddings[order] = np.concatenate(batches)
+        return embeddings
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts, running the model once per distinct text.
+        
+        Duplicates are encoded once and expanded back by index; texts already
+        in the embedding cache are not encoded at all.
+        """
+        encode_kwargs = {
+            "batch_size": GPU_ENCODE_BATCH_SIZE if self.device == "cuda" else CPU_ENCODE_BATCH_SIZE,
+            "show_progress_bar": False,
+            "convert_to_numpy": True,
+            "normalize_embeddings": False
+        }
+        codes, unique_texts = pd.factorize(pd.Series(texts, dtype=object))
+        unique_texts = unique_texts.tolist()
+        with self._encode_lock:
+            if self.embedding_cache is None:
+                return self._model_encode(unique_texts, **encode_kwargs)[codes]
+            
+            missing = self.embedding_cache.find_uncached_texts(unique_texts)
+            if missing:
+                self.embedding_cache.add(missing, self._model_encode(missing, **encode_kwargs))
+            # Look up before saving, since saving may evict entries over the size limit
+            embeddings = self.embedding_cache.lookup(unique_texts)
+            self.embedding_cache.save()
+            return embeddings[codes]
     
     def _compute_text_length_stats(self, texts: pd.Series) -> Dict[str, float]:
         """Compute text length statistics."""
-        lengths = texts.astype(str).str.len()
+        lengths = np.fromiter(map(len, texts.astype(str)), dtype=np.int32, count=len(texts))
+        if lengths.size == 0:
+            return dict.fromkeys(["mean_length", "std_length", "min_length", "max_length"], float("nan"))
         return {
             "mean_length": float(lengths.mean()),
-            "std_length": float(lengths.std()),
+            # Sample std (ddof=1) to match pandas; undefined for a single text
+            "std_length": float(lengths.std(ddof=1)) if lengths.size > 1 else float("nan"),
             "min_length": float(lengths.min()),
             "max_length": float(lengths.max())
         }
     
-    def _compute_vocabulary_richness(self, texts: pd.Series) -> float:
-        """Compute vocabulary richness proxy (unique words / total words)."""
-        all_words = set()
+    def _analyze_tokens(self, texts: pd.Series, n: int = 2, top_k: int = 10) -> Tuple[float, Dict[str, int]]:
+        """
+        Tokenize texts once and compute vocabulary richness and top n-grams.
+        
+        Args:
+            texts: Text values
+            n: N-gram size
+            top_k: Number of most frequent n-grams to return
+            
+        Returns:
+            Tuple of (vocabulary richness proxy (unique words / total words),
+            top n-gram frequencies)
+        """
+        vocabulary = set()
         total_words = 0
+        ngram_counts = Counter()
         for text in texts.astype(str):
+            # str.split measured faster than a compiled-regex findall over the
+            # joined texts, and per-text token lists keep n-grams within a text
             words = text.lower().split()
-            all_words.update(words)
+            vocabulary.update(words)
             total_words += len(words)
+            # Count tuples rather than joined strings: building one string per
+            # n-gram costs more than pd.Series.value_counts saves on counting
+            ngram_counts.update(zip(*(words[i:] for i in range(n))))
         
-        if total_words == 0:
-            return 0.0
-        return len(all_words) / total_words
-    
-    def _compute_top_ngrams(self, texts: pd.Series, n: int = 2, top_k: int = 10) -> Dict[str, int]:
-        """Compute top n-grams frequency."""
-        from collections import Counter
-        
-        ngrams = []
-        for text in texts.astype(str):
-            words = text.lower().split()
-            for i in range(len(words) - n + 1):
-                ngram = " ".join(words[i:i+n])
-                ngrams.append(ngram)
-        
-        counter = Counter(ngrams)
-        return dict(counter.most_common(top_k))
+        richness = len(vocabulary) / total_words if total_words else 0.0
+        top_ngrams = {" ".join(ngram): count for ngram, count in ngram_counts.most_common(top_k)}
+        return richness, top_ngrams
     
     def _compute_embedding_shift(self, ref_texts: pd.Series, cur_texts: pd.Series) -> Dict[str, float]:
         """Compute embedding distribution shift."""
-        if not self.model:
+        if not self.model or min(len(ref_texts), len(cur_texts)) < MIN_EMBEDDING_SAMPLES:
             return {"embedding_shift_score": 0.0, "centroid_distance": 0.0}
         
         try:
-            # Sample if too large
+            # Sample if too large (fixed seed keeps scores comparable across runs)
             max_samples = 1000
-            ref_sample = ref_texts.astype(str).sample(min(len(ref_texts), max_samples))
-            cur_sample = cur_texts.astype(str).sample(min(len(cur_texts), max_samples))
+            ref_sample = ref_texts.astype(str).sample(n=min(len(ref_texts), max_samples), random_state=0)
+            cur_sample = cur_texts.astype(str).sample(n=min(len(cur_texts), max_samples), random_state=0)
             
-            # Generate embeddings
-            ref_embeddings = self.model.encode(ref_sample.tolist(), show_progress_bar=False)
-            cur_embeddings = self.model.encode(cur_sample.tolist(), show_progress_bar=False)
+            # Generate embeddings in one call so sentence-transformers can
+            # length-sort both samples together and pad less per batch
+            all_texts = ref_sample.tolist() + cur_sample.tolist()
+            # Keep embeddings in float32 (the model's dtype) to halve bytes moved
+            embeddings = self._encode(all_texts).astype(np.float32, copy=False)
+            ref_embeddings = embeddings[:len(ref_sample)]
+            cur_embeddings = embeddings[len(ref_sample):]
             
-            # Compute centroids
-            ref_centroid = np.mean(ref_embeddings, axis=0)
-            cur_centroid = np.mean(cur_embeddings, axis=0)
+            # Compute centroids and variances
+            ref_centroid, ref_variance = _embedding_moments(ref_embeddings)
+            cur_centroid, cur_variance = _embedding_moments(cur_embeddings)
             
             # Compute distance
-            centroid_distance = float(np.linalg.norm(ref_centroid - cur_centroid))
+            centroid_delta = ref_centroid - cur_centroid
+            centroid_distance = float(np.sqrt(centroid_delta @ centroid_delta))
             
             # Compute variance shift
-            ref_variance = float(np.var(ref_embeddings))
-            cur_variance = float(np.var(cur_embeddings))
             variance_shift = abs(ref_variance - cur_variance) / (ref_variance + 1e-8)
             
             # Combined shift score
@@ -112,6 +322,55 @@ class TextProfile(Profile):
         except Exception as e:
             return {"embedding_shift_score": 0.0, "error": str(e)}
     
+    def _analyze_column(
+        self,
+        col: str,
+        reference_df: pd.DataFrame,
+        current_df: pd.DataFrame
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Compute text drift metrics for one column (None if either side has no text)."""
+        ref_texts = reference_df[col].dropna()
+        cur_texts = current_df[col].dropna()
+        
+        if len(ref_texts) == 0 or len(cur_texts) == 0:
+            return col, None
+        
+        # Length statistics
+        ref_length_stats = self._compute_text_length_stats(ref_texts)
+        cur_length_stats = self._compute_text_length_stats(cur_texts)
+        length_shift = abs(ref_length_stats["mean_length"] - cur_length_stats["mean_length"]) / (ref_length_stats["mean_length"] + 1e-8)
+        
+        # Vocabulary richness and top n-grams (single tokenization pass)
+        ref_richness, ref_ngrams = self._analyze_tokens(ref_texts)
+        cur_richness, cur_ngrams = self._analyze_tokens(cur_texts)
+        richness_shift = abs(ref_richness - cur_richness)
+        
+        # Top n-grams shift
+        shared_ngrams = ref_ngrams.keys() & cur_ngrams.keys()
+        union_size = len(ref_ngrams) + len(cur_ngrams) - len(shared_ngrams)
+        ngram_overlap = len(shared_ngrams) / max(union_size, 1)
+        ngram_shift = 1.0 - ngram_overlap
+        
+        # Embedding shift
+        embedding_shift = self._compute_embedding_shift(ref_texts, cur_texts)
+        
+        # Combined text drift score
+        text_drift_score = (
+            length_shift * 0.2 +
+            richness_shift * 0.2 +
+            ngram_shift * 0.3 +
+            (embedding_shift.get("embedding_shift_score", 0.0) / 10.0) * 0.3  # Normalize embedding shift
+        )
+        
+        return col, {
+            "text_drift_score": float(text_drift_score),
+            "length_shift": float(length_shift),
+            "richness_shift": float(richness_shift),
+            "ngram_shift": float(ngram_shift),
+            "embedding_shift": embedding_shift,
+            "top_shifted_terms": list(cur_ngrams.keys() - ref_ngrams.keys())[:10]
+        }
+    
     def run(self, reference_df: pd.DataFrame, current_df: pd.DataFrame) -> Dict[str, Any]:
         """
         Run text drift analysis.
@@ -127,61 +386,23 @@ class TextProfile(Profile):
         
         # Find text columns
         if self.text_columns is None:
-            # Auto-detect text columns (string type with high cardinality)
-            text_cols = []
-            for col in reference_df.columns:
-                if reference_df[col].dtype == 'object':
-                    unique_ratio = reference_df[col].nunique() / len(reference_df)
-                    if unique_ratio > 0.1:  # High cardinality suggests text
-                        text_cols.append(col)
-            self.text_columns = text_cols
-        
-        # Analyze each text column
-        for col in self.text_columns:
-            if col not in reference_df.columns or col not in current_df.columns:
-                continue
-            
-            ref_texts = reference_df[col].dropna()
-            cur_texts = current_df[col].dropna()
-            
-            if len(ref_texts) == 0 or len(cur_texts) == 0:
-                continue
-            
-            # Length statistics
-            ref_length_stats = self._compute_text_length_stats(ref_texts)
-            cur_length_stats = self._compute_text_length_stats(cur_texts)
-            length_shift = abs(ref_length_stats["mean_length"] - cur_length_stats["mean_length"]) / (ref_length_stats["mean_length"] + 1e-8)
-            
-            # Vocabulary richness
-            ref_richness = self._compute_vocabulary_richness(ref_texts)
-            cur_richness = self._compute_vocabulary_richness(cur_texts)
-            richness_shift = abs(ref_richness - cur_richness)
-            
-            # Top n-grams shift
-            ref_ngrams = self._compute_top_ngrams(ref_texts)
-            cur_ngrams = self._compute_top_ngrams(cur_texts)
-            ngram_overlap = len(set(ref_ngrams.keys()) & set(cur_ngrams.keys())) / max(len(set(ref_ngrams.keys()) | set(cur_ngrams.keys())), 1)
-            ngram_shift = 1.0 - ngram_overlap
-            
-            # Embedding shift
-            embedding_shift = self._compute_embedding_shift(ref_texts, cur_texts)
-            
-            # Combined text drift score
-            text_drift_score = (
-                length_shift * 0.2 +
-                richness_shift * 0.2 +
-                ngram_shift * 0.3 +
-                (embedding_shift.get("embedding_shift_score", 0.0) / 10.0) * 0.3  # Normalize embedding shift
-            )
-            
-            metrics[f"{col}_text_drift"] = {
-                "text_drift_score": float(text_drift_score),
-                "length_shift": float(length_shift),
-                "richness_shift": float(richness_shift),
-                "ngram_shift": float(ngram_shift),
-                "embedding_shift": embedding_shift,
-                "top_shifted_terms": list(set(cur_ngrams.keys()) - set(ref_ngrams.keys()))[:10]
-            }
+            self.text_columns = _detect_text_columns(reference_df)
+        
+        # Analyze text columns concurrently; model access is serialized in _encode
+        columns = [
+            col for col in self.text_columns
+            if col in reference_df.columns and col in current_df.columns
+        ]
+        analyze = partial(self._analyze_column, reference_df=reference_df, current_df=current_df)
+        if len(columns) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(columns), os.cpu_count() or 1)) as executor:
+                results = list(executor.map(analyze, columns))
+        else:
+            results = [analyze(col) for col in columns]
+        
+        for col, col_metrics in results:
+            if col_metrics is not None:
+                metrics[f"{col}_text_drift"] = col_metrics
         
         return {
             "metrics": metrics,
@@ -5,24 +5,28 @@ import pandas as pd
 from pathlib import Path
 import json
 
+# Evidently pulls in a large import tree; only check that it is installed here
+# and import it when a report is actually generated
 try:
-    # Try Evidently 0.7+ API (direct imports)
+    import importlib.util
+    EVIDENTLY_AVAILABLE = importlib.util.find_spec("evidently") is not None
+except Exception:
+    EVIDENTLY_AVAILABLE = False
+
+
+def _import_evidently():
+    """Import Evidently's Report and DataDriftPreset, supporting old and new APIs."""
     try:
+        # Try Evidently 0.7+ API (direct imports)
         from evidently import Report
         from evidently.presets import DataDriftPreset
         from evidently.core.datasets import ColumnMapping
-        EVIDENTLY_AVAILABLE = True
     except ImportError:
         # Try older API
-        try:
-            from evidently.report import Report
-            from evidently.metric_preset import DataDriftPreset
-            from evidently.pipeline.column_mapping import ColumnMapping
-            EVIDENTLY_AVAILABLE = True
-        except ImportError:
-            EVIDENTLY_AVAILABLE = False
-except Exception:
-    EVIDENTLY_AVAILABLE = False
+        from evidently.report import Report
+        from evidently.metric_preset import DataDriftPreset
+        from evidently.pipeline.column_mapping import ColumnMapping
+    return Report, DataDriftPreset
 
 
 def generate_evidently_report(
@@ -45,6 +49,10 @@ def generate_evidently_report(
     """
     if not EVIDENTLY_AVAILABLE:
         raise ImportError("evidently package is required. Install with: pip install evidently")
+    try:
+        Report, DataDriftPreset = _import_evidently()
+    except Exception as e:
+        raise ImportError(f"Unsupported evidently installation: {e}") from e
     
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
@@ -100,10 +108,17 @@ def generate_evidently_report(
             }
         }
     
+    # Materialize the snapshot once; only serialize to JSON if dict() fails
     try:
-        # Get snapshot as dict
         snapshot_dict = snapshot.dict()
-        
+    except Exception:
+        try:
+            snapshot_dict = json.loads(snapshot.json())
+        except Exception:
+            # If all else fails, use default values
+            snapshot_dict = {}
+    
+    try:
         # Navigate through Evidently's metric structure
         for metric_data in snapshot_dict.get('metrics', []):
             metric_result = metric_data.get('result', {})
@@ -125,30 +140,9 @@ def generate_evidently_report(
                     
                     if drift_detected:
                         drifting_columns.append(col_name)
-    except Exception as e:
-        # Fallback: try to get from snapshot directly
-        try:
-            snapshot_json = snapshot.json()
-            import json
-            report_data = json.loads(snapshot_json)
-            
-            for metric_data in report_data.get('metrics', []):
-                metric_result = metric_data.get('result', {})
-                if 'dataset_drift_score' in metric_result:
-                    dataset_drift_score = metric_result['dataset_drift_score']
-                if 'drift_by_columns' in metric_result:
-                    for col_name, col_result in metric_result['drift_by_columns'].items():
-                        drift_score = col_result.get('drift_score', 0.0)
-                        drift_detected = drift_score > 0.3
-                        drift_metrics[col_name] = {
-                            "drift_score": drift_score,
-                            "drift_detected": drift_detected
-                        }
-                        if drift_detected:
-                            drifting_columns.append(col_name)
-        except Exception:
-            # If all else fails, use default values
-            pass
+    except Exception:
+        # Malformed metric structure: keep whatever was extracted
+        pass
     
     # Compile summary metrics
     summary_metrics = {
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 from typing import Dict, Any
-import json
+from driftlab.io.jsonio import write_json
 
 
 def save_json_report(data: Dict[str, Any], output_path: str) -> None:
@@ -10,6 +10,4 @@ def save_json_report(data: Dict[str, Any], output_path: str) -> None:
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
-
+    write_json(path, data)
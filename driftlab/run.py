@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 
 from driftlab.io.load import load_dataframe
@@ -14,6 +15,11 @@ from driftlab.alerts.rules import DatasetDriftRule, FeatureDriftPersistenceRule
 from driftlab.alerts.thresholds import ThresholdCalibrator
 
 
+def _serializable_validation(validation: Dict[str, Any]) -> Dict[str, Any]:
+    """Validation result with SchemaError entries converted to plain dicts."""
+    return {**validation, "errors": [error.to_dict() for error in validation["errors"]]}
+
+
 def run_drift_analysis(
     ref_path: str,
     cur_path: str,
@@ -36,15 +42,16 @@ def run_drift_analysis(
         with open(config_path, 'r') as f:
             config = yaml.safe_load(f)
     
-    # Load datasets
-    ref_df = load_dataframe(ref_path)
-    cur_df = load_dataframe(cur_path)
+    # Load datasets (I/O-bound, so both files are read concurrently)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ref_future = executor.submit(load_dataframe, ref_path)
+        cur_future = executor.submit(load_dataframe, cur_path)
+        ref_df, cur_df = ref_future.result(), cur_future.result()
     
     # Schema validation
     column_types = config.get('column_types', {})
     schema = Schema(column_types=column_types)
-    ref_validation = schema.validate(ref_df)
-    cur_validation = schema.validate(cur_df)
+    ref_validation, cur_validation = schema.validate_batch([ref_df, cur_df])
     
     # Generate reports
     output_path = Path(output_dir)
@@ -55,7 +62,6 @@ def run_drift_analysis(
     column_mapping = config.get('column_mapping', None)
     
     # Filter out text columns for Evidently (it has issues with text processing)
-    column_types = config.get('column_types', {})
     text_cols_set = set(text_columns or [])
     # Also detect text columns from column_types
     for col, col_type in column_types.items():
@@ -66,17 +72,21 @@ def run_drift_analysis(
     ref_df_tabular = ref_df.drop(columns=[c for c in text_cols_set if c in ref_df.columns], errors='ignore')
     cur_df_tabular = cur_df.drop(columns=[c for c in text_cols_set if c in cur_df.columns], errors='ignore')
     
-    # Run profiles
+    # Run profiles and the Evidently report (only on non-text columns)
+    # concurrently. They only read the frames; threads are used because the
+    # text model and Evidently's report state are not cheap to pickle.
     tabular_profile = TabularProfile(column_mapping=column_mapping)
-    tabular_results = tabular_profile.run(ref_df, cur_df)
-    
     text_profile = TextProfile(text_columns=text_columns)
-    text_results = text_profile.run(ref_df, cur_df)
-    
-    # Generate Evidently report (only on non-text columns)
-    evidently_results = generate_evidently_report(
-        ref_df_tabular, cur_df_tabular, output_dir, column_mapping=column_mapping
-    )
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        tabular_future = executor.submit(tabular_profile.run, ref_df, cur_df)
+        text_future = executor.submit(text_profile.run, ref_df, cur_df)
+        evidently_future = executor.submit(
+            generate_evidently_report,
+            ref_df_tabular, cur_df_tabular, output_dir, column_mapping=column_mapping
+        )
+        tabular_results = tabular_future.result()
+        text_results = text_future.result()
+        evidently_results = evidently_future.result()
     
     # Combine all metrics
     all_metrics = {
@@ -100,18 +110,19 @@ def run_drift_analysis(
             threshold=alert_config.get('feature_drift_threshold'),
             consecutive_runs=alert_config.get('consecutive_runs', 3),
             calibrator=calibrator,
-            history_file=history_file
+            # Kept apart from the calibrator's metric history, which has a different format
+            history_file=history_file + ".persistence"
         )
     ]
     
     # Add metrics to history for calibration
     calibrator.add_metrics(all_metrics)
     
-    # Evaluate alerts
+    # Evaluate alerts (bound methods resolved once, ahead of the loop)
+    rule_evals = [rule.evaluate for rule in alert_rules]
     all_alerts = []
-    for rule in alert_rules:
-        alerts = rule.evaluate(all_metrics)
-        all_alerts.extend(alerts)
+    for evaluate in rule_evals:
+        all_alerts.extend(evaluate(all_metrics))
     
     # Save summary
     summary = {
@@ -119,8 +130,8 @@ def run_drift_analysis(
         "reference_path": ref_path,
         "current_path": cur_path,
         "validation": {
-            "reference": ref_validation,
-            "current": cur_validation
+            "reference": _serializable_validation(ref_validation),
+            "current": _serializable_validation(cur_validation)
         },
         "metrics": all_metrics,
         "alerts": all_alerts,
@@ -0,0 +1,61 @@
+"""Shared pytest fixtures."""
+
+import os
+from pathlib import Path
+import pytest
+from driftlab.io.schema import Schema, ColumnType
+from driftlab.profiles.tabular import TabularProfile
+from driftlab.profiles.text import TextProfile
+
+
+def pytest_addoption(parser):
+    """Add the --model-cache option."""
+    parser.addoption(
+        "--model-cache",
+        default=None,
+        help="Directory for downloaded embedding models (defaults to .pytest_cache/d/models)"
+    )
+
+
+def pytest_configure(config):
+    """Register the xdist_group marker and point model downloads at a persistent cache."""
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing an expensive fixture on one xdist worker"
+    )
+    
+    # sentence-transformers is imported lazily, so this runs before any model loads.
+    # Explicit SENTENCE_TRANSFORMERS_HOME/HF_HOME settings take precedence.
+    model_cache = config.getoption("--model-cache")
+    if model_cache is None and getattr(config, "cache", None) is not None:
+        model_cache = config.cache.mkdir("models")
+    if model_cache is not None:
+        os.environ.setdefault("SENTENCE_TRANSFORMERS_HOME", str(Path(model_cache) / "st"))
+        os.environ.setdefault("HF_HOME", str(Path(model_cache) / "hf"))
+
+
+@pytest.fixture(scope="session")
+def text_profile(tmp_path_factory):
+    """Text profile built once per session (loading the embedding model is slow)."""
+    return TextProfile(text_columns=["text_col"], cache_dir=str(tmp_path_factory.mktemp("embeddings")))
+
+
+@pytest.fixture(scope="session")
+def tabular_profile():
+    """Tabular profile shared across tests."""
+    return TabularProfile()
+
+
+@pytest.fixture(scope="session")
+def schemas():
+    """Schemas shared across validation test cases, by name."""
+    return {
+        "full": Schema(
+            column_types={
+                "numerical_col": ColumnType.NUMERICAL,
+                "categorical_col": ColumnType.CATEGORICAL,
+                "text_col": ColumnType.TEXT
+            },
+            required_columns=["numerical_col", "categorical_col"]
+        ),
+        "required_only": Schema(required_columns=["numerical_col", "missing_col"])
+    }
@@ -0,0 +1,39 @@
+"""Tests for alert rules."""
+
+from driftlab.io.jsonio import read_json
+from driftlab.alerts.rules import FeatureDriftPersistenceRule
+from driftlab.alerts.thresholds import ThresholdCalibrator
+
+
+DRIFTED_METRICS = {"column_drift_scores": {"feature": {"drift_score": 0.9}}}
+
+
+def test_persistence_history_buffered_until_flush(tmp_path):
+    """Test that autosave=False defers writes to flush() and that the history round-trips."""
+    history_file = tmp_path / "history.json"
+    rule = FeatureDriftPersistenceRule(
+        threshold=0.5, consecutive_runs=3, history_file=str(history_file), autosave=False
+    )
+    
+    alerts = [rule.evaluate(DRIFTED_METRICS) for _ in range(3)]
+    assert not history_file.exists()
+    assert [len(a) for a in alerts] == [0, 0, 1]
+    
+    rule.flush()
+    assert read_json(history_file) == {"feature": [True, True, True]}
+    assert list(tmp_path.iterdir()) == [history_file]
+    
+    # A fresh rule picks up the stored runs, so one more drifted run still alerts
+    reloaded = FeatureDriftPersistenceRule(threshold=0.5, consecutive_runs=3, history_file=str(history_file))
+    assert len(reloaded.evaluate(DRIFTED_METRICS)) == 1
+    assert read_json(history_file) == {"feature": [True, True, True]}
+
+
+def test_persistence_rule_ignores_calibrator_history(tmp_path):
+    """Test that a history file holding the calibrator's metric list is treated as empty."""
+    history_file = tmp_path / "history.json"
+    ThresholdCalibrator(history_file=str(history_file)).add_metrics(DRIFTED_METRICS)
+    rule = FeatureDriftPersistenceRule(threshold=0.5, consecutive_runs=1, history_file=str(history_file))
+    
+    assert len(rule.evaluate(DRIFTED_METRICS)) == 1
+    assert read_json(history_file) == {"feature": [True]}
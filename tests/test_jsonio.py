@@ -0,0 +1,16 @@
+"""Tests for JSON helpers."""
+
+import json
+import math
+from driftlab.io.jsonio import read_json
+
+
+def test_read_json_accepts_stdlib_nan(tmp_path):
+    """Test that NaN/Infinity written by the stdlib encoder can be read back."""
+    path = tmp_path / "history.json"
+    path.write_text(json.dumps([{"drift_score": float("nan"), "share": float("inf")}]))
+    
+    history = read_json(path)
+    
+    assert math.isnan(history[0]["drift_score"])
+    assert history[0]["share"] == float("inf")
@@ -0,0 +1,70 @@
+"""Tests for data loading."""
+
+import pytest
+import numpy as np
+import pandas as pd
+from data.synthetic import generate
+from data.synthetic.generate import generate_baseline_dataset, generate_demo_data
+from driftlab.io.load import load_dataframe
+
+
+CSV_WITH_MISSING = (
+    "label,comment,day,value,empty\n"
+    "x,,2024-01-01,1,\n"
+    "NA,y,2024-01-02,,\n"
+    "N/A,z,2024-01-03,3,\n"
+)
+
+# Written by DataFrame.to_csv with its default index column
+CSV_WITH_INDEX = ",label,value\n0,x,1\n1,,2\n"
+
+CSV_WITH_DUPLICATE_HEADER = "a,a,b\nx,1,2\ny,3,\n"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [CSV_WITH_MISSING, CSV_WITH_INDEX, CSV_WITH_DUPLICATE_HEADER],
+    ids=["missing_values", "unnamed_index", "duplicate_header"]
+)
+def test_load_csv_matches_pandas(tmp_path, content):
+    """Test that CSVs load exactly as pd.read_csv reads them."""
+    path = tmp_path / "data.csv"
+    path.write_text(content)
+    
+    df = load_dataframe(str(path))
+    
+    pd.testing.assert_frame_equal(df, pd.read_csv(path))
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather", "csv"])
+def test_demo_data_round_trip(tmp_path, file_format):
+    """Test that demo data written in each format loads back unchanged."""
+    generate_demo_data(output_dir=str(tmp_path), n_samples=200, seed=7, file_format=file_format)
+    
+    ref_df = load_dataframe(str(tmp_path / "reference" / f"ref.{file_format}"))
+    
+    expected = generate_baseline_dataset(n_samples=200, seed=7)
+    # CSV has no categorical type, so those columns come back as plain strings
+    pd.testing.assert_frame_equal(
+        ref_df, expected, check_dtype=file_format != "csv", check_categorical=file_format != "csv"
+    )
+    assert (tmp_path / "current" / f"cur.{file_format}").exists()
+
+
+def test_demo_data_rejects_unknown_format(tmp_path):
+    """Test that an unsupported output format is an error."""
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        generate_demo_data(output_dir=str(tmp_path), n_samples=10, file_format="xlsx")
+
+
+def test_parallel_demo_data_shares_category_distribution(tmp_path, monkeypatch):
+    """Test that parallel chunks sample categories from one shared distribution."""
+    monkeypatch.setattr(generate, "PARALLEL_THRESHOLD", 100)
+    generate_demo_data(output_dir=str(tmp_path), n_samples=3000, seed=7, workers=3)
+    
+    ref_df = load_dataframe(str(tmp_path / "reference" / "ref.parquet"))
+    
+    assert len(ref_df) == 3000
+    success = (ref_df["status"] == "success").to_numpy()
+    shares = [block.mean() for block in np.array_split(success, 3)]
+    assert max(shares) - min(shares) < 0.1
@@ -1,43 +1,144 @@
 """Tests for drift profiles."""
 
+import subprocess
+import sys
+from pathlib import Path
 import pytest
+import numpy as np
 import pandas as pd
-from driftlab.profiles.tabular import TabularProfile
-from driftlab.profiles.text import TextProfile
 
 
-def test_tabular_profile():
+# Frames are built once at import; the profiles only read their inputs
+# Columns are built with explicit dtypes so pandas skips dtype inference
+REF_TAB = pd.DataFrame({
+    "col1": np.arange(1, 6, dtype=np.int64),
+    "col2": np.arange(10, 60, 10, dtype=np.int64)
+})
+CUR_TAB = pd.DataFrame({
+    "col1": np.arange(2, 7, dtype=np.int64),
+    "col2": np.arange(15, 65, 10, dtype=np.int64)
+})
+
+REF_TEXT = pd.DataFrame({
+    "text_col": pd.array(["hello world", "foo bar", "baz qux"], dtype="string")
+})
+CUR_TEXT = pd.DataFrame({
+    "text_col": pd.array(["hello world changed", "foo bar modified", "baz qux updated"], dtype="string")
+})
+
+_rng = np.random.default_rng(0)
+REF_VARIABLE_TEXT = pd.DataFrame({"text_col": ["x " * k for k in _rng.integers(1, 128, size=256)]})
+CUR_VARIABLE_TEXT = pd.DataFrame({"text_col": ["y " * k for k in _rng.integers(1, 128, size=256)]})
+
+
+@pytest.mark.xdist_group("tabular")
+@pytest.mark.parametrize("key", ["metrics", "artifacts"])
+def test_tabular_profile(tabular_profile, key):
     """Test tabular profile execution."""
-    ref_df = pd.DataFrame({
-        "col1": [1, 2, 3, 4, 5],
-        "col2": [10, 20, 30, 40, 50]
-    })
-    cur_df = pd.DataFrame({
-        "col1": [2, 3, 4, 5, 6],
-        "col2": [15, 25, 35, 45, 55]
-    })
+    result = tabular_profile.run(REF_TAB, CUR_TAB)
     
-    profile = TabularProfile()
-    result = profile.run(ref_df, cur_df)
-    
-    assert "metrics" in result
-    assert "artifacts" in result
+    assert key in result
 
 
-def test_text_profile():
+@pytest.mark.xdist_group("text_model")
+def test_text_profile(text_profile):
     """Test text profile execution."""
-    ref_df = pd.DataFrame({
-        "text_col": ["hello world", "foo bar", "baz qux"]
-    })
-    cur_df = pd.DataFrame({
-        "text_col": ["hello world changed", "foo bar modified", "baz qux updated"]
-    })
+    pytest.importorskip("sentence_transformers")
+    result = text_profile.run(REF_TEXT, CUR_TEXT)
+    
+    # With sentence-transformers installed, a model that failed to load is a failure
+    assert text_profile.model is not None
+    assert any("text_drift" in key for key in result["metrics"])
+
+
+@pytest.mark.xdist_group("text_model")
+def test_text_profile_variable_length_texts(text_profile):
+    """Test text profile on enough varied-length texts to reach the embedding path."""
+    result = text_profile.run(REF_VARIABLE_TEXT, CUR_VARIABLE_TEXT)
+    
+    metrics = result["metrics"]["text_col_text_drift"]
+    assert metrics["ngram_shift"] == 1.0
+    assert "embedding_shift_score" in metrics["embedding_shift"]
+
+
+@pytest.mark.xdist_group("text_model")
+def test_text_profile_token_sorted_encode_keeps_order(text_profile):
+    """Test that token-length batching returns embeddings in input order."""
+    if text_profile.model is None:
+        pytest.skip("sentence-transformers model not available")
+    texts = CUR_VARIABLE_TEXT["text_col"].tolist()[:200]
+    
+    embeddings = text_profile._model_encode(texts, batch_size=64, show_progress_bar=False)
+    expected = text_profile.model.encode(texts, batch_size=64, show_progress_bar=False)
+    
+    np.testing.assert_allclose(embeddings, expected, atol=1e-4)
+
+
+@pytest.mark.xdist_group("text_model")
+def test_text_profile_leaves_inference_mode_disabled(text_profile):
+    """Test that embedding inference does not leave autograd disabled globally."""
+    torch = pytest.importorskip("torch")
+    texts = pd.DataFrame({"text_col": [f"sample text {i}" for i in range(64)]})
+    
+    text_profile.run(texts, texts)
+    
+    assert not torch.is_inference_mode_enabled()
+
+
+@pytest.mark.xdist_group("text_model")
+@pytest.mark.parametrize("precision", ["fp16", "int8"])
+def test_text_profile_precision_matches_fp32(precision):
+    """Test that reduced-precision embeddings stay close to the fp32 baseline."""
+    pytest.importorskip("sentence_transformers")
+    from driftlab.profiles.text import TextProfile
+    
+    texts = [f"sample text number {i}" for i in range(64)]
+    baseline = TextProfile(precision="fp32", use_embedding_cache=False)
+    reduced = TextProfile(precision=precision, use_embedding_cache=False)
+    if baseline.model is None or reduced.precision == "fp32":
+        pytest.skip(f"{precision} not supported on this device")
+    
+    ref = baseline._encode(texts).astype(np.float32)
+    emb = reduced._encode(texts).astype(np.float32)
+    cosine = (ref * emb).sum(axis=1) / (np.linalg.norm(ref, axis=1) * np.linalg.norm(emb, axis=1))
+    assert np.all(cosine > 1 - 1e-2)
+
+
+def test_profile_imports_defer_heavy_dependencies():
+    """Test that importing the profiles and runner does not load model or report libraries."""
+    heavy = ["sentence_transformers", "torch", "transformers", "evidently", "numba"]
+    code = (
+        "import sys, driftlab.profiles.text, driftlab.profiles.tabular, driftlab.run; "
+        f"print([m for m in {heavy!r} if m in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        cwd=Path(__file__).resolve().parents[1]
+    )
     
-    profile = TextProfile(text_columns=["text_col"])
-    result = profile.run(ref_df, cur_df)
+    assert output.stdout.strip() == "[]"
+
+
+def test_detect_text_columns_uses_full_column():
+    """Test that text column detection reflects every row, not just a prefix."""
+    from driftlab.profiles.text import _detect_text_columns
+    constant = pd.DataFrame({"t": pd.array(["same"] * 1000, dtype="string")})
+    varied = pd.DataFrame({"t": pd.array(["same"] * 99 + [f"text {i}" for i in range(901)], dtype="string")})
     
-    assert "metrics" in result
-    # Text drift metrics should be present if model is available
-    if result["metrics"]:
-        assert any("text_drift" in key for key in result["metrics"].keys())
+    assert _detect_text_columns(constant) == []
+    assert _detect_text_columns(varied) == ["t"]
 
+
+def test_embedding_cache_evicts_least_recently_used(tmp_path):
+    """Test that the embedding cache keeps at most max_entries, dropping the least recently used."""
+    from driftlab.profiles._embed_cache import EmbeddingCache
+    cache = EmbeddingCache("model", cache_dir=str(tmp_path), max_entries=2)
+    cache.add(["a", "b"], np.eye(2, dtype=np.float32))
+    cache.find_uncached_texts(["a"])
+    cache.add(["c"], np.ones((1, 2), dtype=np.float32))
+    cache.save()
+    
+    reloaded = EmbeddingCache("model", cache_dir=str(tmp_path), max_entries=2)
+    
+    assert reloaded.find_uncached_texts(["a", "b", "c"]) == ["b"]
+    np.testing.assert_array_equal(reloaded.lookup(["a", "c"]), [[1, 0], [1, 1]])
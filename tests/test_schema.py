@@ -1,40 +1,92 @@
 """Tests for schema validation."""
 
 import pytest
+import numpy as np
 import pandas as pd
-from driftlab.io.schema import Schema, ColumnType
-
-
-def test_schema_validation():
-    """Test basic schema validation."""
-    df = pd.DataFrame({
-        "numerical_col": [1, 2, 3, 4, 5],
-        "categorical_col": ["A", "B", "A", "B", "A"],
-        "text_col": ["text1", "text2", "text3", "text4", "text5"]
-    })
-    
-    schema = Schema(
-        column_types={
-            "numerical_col": ColumnType.NUMERICAL,
-            "categorical_col": ColumnType.CATEGORICAL,
-            "text_col": ColumnType.TEXT
-        },
-        required_columns=["numerical_col", "categorical_col"]
-    )
-    
-    result = schema.validate(df)
-    assert result["valid"] is True
-    assert "numerical_col" in result["quality_metrics"]
+from driftlab.io import jsonio
+from driftlab.io.jsonio import read_json, write_json
+from driftlab.io.schema import Schema, ColumnType, ErrorCode
+
+
+# Frames are built once at import; Schema.validate does not modify them
+# (no timestamp column is configured)
+FULL_DF = pd.DataFrame({
+    "numerical_col": np.arange(1, 6, dtype=np.float64),
+    "categorical_col": pd.Categorical(["A", "B", "A", "B", "A"]),
+    "text_col": pd.array(["text1", "text2", "text3", "text4", "text5"], dtype="string")
+})
 
+MISSING_COLUMN_DF = pd.DataFrame({
+    "numerical_col": np.arange(1, 4, dtype=np.int64)
+})
 
-def test_missing_required_column():
-    """Test validation with missing required column."""
-    df = pd.DataFrame({
-        "numerical_col": [1, 2, 3]
-    })
+
+@pytest.mark.parametrize(
+    "schema_name,df,expected_valid,error_code",
+    [
+        ("full", FULL_DF, True, None),
+        ("required_only", MISSING_COLUMN_DF, False, ErrorCode.MISSING_REQUIRED),
+    ],
+    ids=["valid", "missing_col"]
+)
+def test_schema(schemas, schema_name, df, expected_valid, error_code):
+    """Test schema validation outcomes."""
+    result = schemas[schema_name].validate(df)
+    
+    assert result["valid"] is expected_valid
+    if error_code is not None:
+        assert any(error.code == error_code for error in result["errors"])
+        assert result["quality_metrics"] == {}
+    else:
+        assert "numerical_col" in result["quality_metrics"]
+
+
+def test_schema_missing_columns_without_early_exit(schemas):
+    """Test that quality metrics are still computed when early exit is disabled."""
+    result = schemas["required_only"].validate(MISSING_COLUMN_DF, early_exit=False)
     
-    schema = Schema(required_columns=["numerical_col", "missing_col"])
-    result = schema.validate(df)
     assert result["valid"] is False
-    assert "Missing required columns" in str(result["errors"])
+    assert "numerical_col" in result["quality_metrics"]
+
 
+def test_schema_validate_batch(schemas):
+    """Test that batch validation matches validating each frame on its own."""
+    frames = [FULL_DF] * 100 + [MISSING_COLUMN_DF]
+    
+    results = schemas["full"].validate_batch(frames)
+    
+    assert len(results) == len(frames)
+    assert results[0] == schemas["full"].validate(FULL_DF)
+    assert results[-1] == schemas["full"].validate(MISSING_COLUMN_DF)
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test against both JSON backends."""
+    if request.param and not jsonio.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(jsonio, "ORJSON_AVAILABLE", request.param)
+
+
+def test_numeric_categories_serialize(tmp_path, json_backend):
+    """Test that top values of numeric categories can be written to JSON."""
+    schema = Schema(column_types={"code": ColumnType.CATEGORICAL})
+    result = schema.validate(pd.DataFrame({"code": pd.Categorical([1, 2, 2, 3])}))
+    
+    write_json(tmp_path / "result.json", result)
+    
+    assert read_json(tmp_path / "result.json")["quality_metrics"]["code"]["top_values"] == {"2": 2, "1": 1, "3": 1}
+
+
+def test_validation_errors_serialize(tmp_path, json_backend, schemas):
+    """Test that validation errors are written the same way by both JSON backends."""
+    from driftlab.run import _serializable_validation
+    result = schemas["required_only"].validate(MISSING_COLUMN_DF)
+    
+    write_json(tmp_path / "result.json", _serializable_validation(result))
+    
+    assert read_json(tmp_path / "result.json")["errors"] == [{
+        "code": ErrorCode.MISSING_REQUIRED,
+        "columns": ["missing_col"],
+        "message": "Missing required columns: ['missing_col']"
+    }]